@@ -1,14 +1,19 @@
 """Cryptography visualization entry point."""
 from __future__ import annotations
 
-from typing import Iterable
+import os
+from typing import TYPE_CHECKING, Iterable
 
 import streamlit as st
 
-from visualization import birthday_views, pollard_views, ui_components
+from visualization import ui_components
+
+if TYPE_CHECKING:
+    from core.store import ResultStore
 
 
 DEFAULT_DIFFICULTY_BITS: Iterable[int] = [8, 12, 16, 20, 24]
+RESULTS_DIR = os.environ.get("CRYPTO_RESULTS_DIR", "results")
 
 
 def _running_inside_streamlit() -> bool:
@@ -20,33 +25,43 @@ def _running_inside_streamlit() -> bool:
         return False
 
 
-def _render_birthday(params: ui_components.BirthdayParameters) -> None:
+def _render_birthday(params: ui_components.BirthdayParameters, store: ResultStore) -> None:
+    # Page modules are imported per render so only the selected page's plotting stack loads.
+    from visualization import birthday_views, scaling_views
+
     st.markdown(
         """
         The **Birthday Attack** is a statistical technique to find collisions in hash functions. 
         It exploits the mathematics behind the birthday problem in probability theory.
         """
     )
-    birthday_views.show_birthday(params)
+    birthday_views.show_birthday(params, store=store)
     st.divider()
-    birthday_views.show_difficulty_scaling(DEFAULT_DIFFICULTY_BITS)
+    scaling_views.show_difficulty_scaling(DEFAULT_DIFFICULTY_BITS)
+    st.subheader("Run history")
+    birthday_views.show_birthday_history(store)
 
 
-def _render_pollard(params: ui_components.PollardParameters) -> None:
+def _render_pollard(params: ui_components.PollardParameters, store: ResultStore) -> None:
+    from visualization import pollard_views, scaling_views
+
     st.markdown(
         """
         **Pollard's Rho** is an algorithm for finding collisions in hash functions. 
         It uses a random walk to detect a cycle in the sequence of hashed values.
         """
     )
-    pollard_views.show_pollard(params)
+    pollard_views.show_pollard(params, store=store)
     st.divider()
-    birthday_views.show_difficulty_scaling(DEFAULT_DIFFICULTY_BITS)
+    scaling_views.show_difficulty_scaling(DEFAULT_DIFFICULTY_BITS)
+    st.subheader("Run history")
+    pollard_views.show_pollard_history(store)
 
 
 def main() -> None:
     if not _running_inside_streamlit():
         print("This application is designed to run with 'streamlit run app.py'.")
+        print("For headless parameter sweeps use 'python -m core.batch --help'.")
         return
 
     st.set_page_config(page_title="Hash Function Visualizer", page_icon="🔐", layout="wide")
@@ -64,10 +79,14 @@ def main() -> None:
             st.warning("Unknown attack selection.")
             return
 
+    # Deferred like the page modules: the store pulls in numpy.
+    from core.store import ResultStore
+
+    store = ResultStore(RESULTS_DIR)
     if attack == "Birthday Attack":
-        _render_birthday(params)
+        _render_birthday(params, store)
     elif attack == "Pollard's Rho":
-        _render_pollard(params)
+        _render_pollard(params, store)
 
 
 if __name__ == "__main__":
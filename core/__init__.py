@@ -2,7 +2,7 @@
 from .common import CollisionResult, SampledSequence, random_message, iter_random_messages
 from .hash_utils import toy_hash
 from .birthday import birthday_attack, estimate_collision_probability, simulate_birthday_trials, BirthdayRun
-from .pollard import pollard_rho, pollard_trace
+from .pollard import RhoWalk, pollard_rho, pollard_trace
 
 __all__ = [
     "CollisionResult",
@@ -12,6 +12,7 @@ __all__ = [
     "estimate_collision_probability",
     "simulate_birthday_trials",
     "BirthdayRun",
+    "RhoWalk",
     "pollard_rho",
     "pollard_trace",
     "random_message",
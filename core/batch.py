@@ -0,0 +1,229 @@
+"""Headless batch runner for large parameter sweeps.
+
+Usage::
+
+    python -m core.batch --bits 8 12 16 --runs 200 --message-length 8 \\
+        --engine birthday pollard --workers 8 --out results/
+
+Every grid cell is appended to the ``ResultStore`` at ``<out>`` as a segment of
+the engine's table as soon as it finishes, and its wall-clock timing is
+appended to ``<out>/timings.jsonl``. Re-running the same command skips cells
+already recorded in the store, so an interrupted sweep resumes where it stopped.
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+import itertools
+import json
+import os
+from pathlib import Path
+import random
+import sys
+import time
+from typing import Any, Callable, Iterable, Sequence
+
+from .birthday import simulate_birthday_trials
+from .common import RANDOM_MESSAGE_LENGTH
+from .hash_utils import DEFAULT_HASH_BITS
+from .pollard import PollardResult, pollard_rho
+from .store import ResultStore, birthday_columns, pollard_columns
+
+
+TIMINGS_FILENAME = "timings.jsonl"
+
+Columns = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class BatchCell:
+    """One point of the sweep grid."""
+
+    engine: str
+    bits: int
+    runs: int
+    message_length: int
+    max_trials: int
+    seed: int | None
+
+    @property
+    def key(self) -> str:
+        # Every field is part of the key so a resume only skips identical work.
+        seed = "none" if self.seed is None else self.seed
+        return f"{self.engine}-b{self.bits}-r{self.runs}-m{self.message_length}-t{self.max_trials}-s{seed}"
+
+
+def _cell_rng(cell: BatchCell) -> random.Random | None:
+    # String seeds hash deterministically, so each cell gets a stable stream.
+    return None if cell.seed is None else random.Random(cell.key)
+
+
+def _run_birthday(cell: BatchCell) -> Columns:
+    runs = simulate_birthday_trials(
+        bits=cell.bits,
+        runs=cell.runs,
+        rng=_cell_rng(cell),
+        message_length=cell.message_length,
+        max_trials=cell.max_trials,
+    )
+    return birthday_columns(runs)
+
+
+def _run_pollard(cell: BatchCell) -> Columns:
+    # The walk itself is deterministic, so the seed picks the start states.
+    rng = _cell_rng(cell) or random.Random()
+    space = 2**cell.bits
+    if cell.runs <= space:
+        starts = rng.sample(range(space), cell.runs)
+    else:
+        starts = [rng.randrange(space) for _ in range(cell.runs)]
+    results: list[PollardResult | None] = []
+    for start in starts:
+        try:
+            results.append(pollard_rho(bits=cell.bits, start=start, max_steps=cell.max_trials))
+        except RuntimeError:
+            results.append(None)
+    return pollard_columns(starts, results)
+
+
+# Engines flagged ``False`` ignore the message length, so the grid collapses it.
+ENGINES: dict[str, tuple[Callable[[BatchCell], Columns], bool]] = {
+    "birthday": (_run_birthday, True),
+    "pollard": (_run_pollard, False),
+}
+
+
+def build_grid(
+    *,
+    engines: Iterable[str],
+    bits: Iterable[int],
+    runs: Iterable[int],
+    message_lengths: Iterable[int],
+    max_trials: int = 1_000_000,
+    seed: int | None = None,
+) -> list[BatchCell]:
+    """Return the de-duplicated cartesian product of the sweep parameters."""
+
+    cells: dict[BatchCell, None] = {}
+    for engine, bit_size, run_count, length in itertools.product(engines, bits, runs, message_lengths):
+        if engine not in ENGINES:
+            raise ValueError(f"unknown engine {engine!r}")
+        if not ENGINES[engine][1]:
+            length = 0
+        cell = BatchCell(
+            engine=engine,
+            bits=bit_size,
+            runs=run_count,
+            message_length=length,
+            max_trials=max_trials,
+            seed=seed,
+        )
+        cells[cell] = None
+    return list(cells)
+
+
+def run_cell(cell: BatchCell) -> tuple[Columns, float]:
+    """Execute ``cell`` and return its result columns with elapsed seconds."""
+
+    runner, _ = ENGINES[cell.engine]
+    started = time.perf_counter()
+    columns = runner(cell)
+    return columns, time.perf_counter() - started
+
+
+def _write_cell(
+    store: ResultStore,
+    cell: BatchCell,
+    columns: Columns,
+    seconds: float,
+) -> None:
+    store.append(cell.engine, columns, asdict(cell), name=cell.key)
+    record = {**asdict(cell), "key": cell.key, "seconds": seconds}
+    with open(store.root / TIMINGS_FILENAME, "a", encoding="utf-8") as handle:
+        handle.write(json.dumps(record) + "\n")
+
+
+def run_batch(
+    cells: Sequence[BatchCell],
+    out_dir: Path,
+    *,
+    workers: int = 1,
+    log: Callable[[str], None] | None = None,
+) -> list[BatchCell]:
+    """Run every unfinished cell, writing results as they complete.
+
+    Returns the cells that were executed during this call.
+    """
+
+    store = ResultStore(out_dir)
+    store.root.mkdir(parents=True, exist_ok=True)
+    finished = {engine: store.segment_names(engine) for engine in {cell.engine for cell in cells}}
+    pending = [cell for cell in cells if cell.key not in finished[cell.engine]]
+    if log is not None and len(pending) < len(cells):
+        log(f"skipping {len(cells) - len(pending)} finished cells")
+
+    def finish(index: int, cell: BatchCell, columns: Columns, seconds: float) -> None:
+        _write_cell(store, cell, columns, seconds)
+        if log is not None:
+            log(f"[{index}/{len(pending)}] {cell.key} {seconds:.3f}s")
+
+    if workers <= 1:
+        for index, cell in enumerate(pending, start=1):
+            finish(index, cell, *run_cell(cell))
+        return pending
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_cell, cell): cell for cell in pending}
+        for index, future in enumerate(as_completed(futures), start=1):
+            finish(index, futures[future], *future.result())
+    return pending
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m core.batch",
+        description="Run a resumable grid of collision experiments without Streamlit.",
+    )
+    parser.add_argument("--out", type=Path, required=True, help="result store directory")
+    parser.add_argument("--engine", nargs="+", default=["birthday"], choices=sorted(ENGINES))
+    parser.add_argument("--bits", nargs="+", type=int, default=[DEFAULT_HASH_BITS])
+    parser.add_argument("--runs", nargs="+", type=int, default=[100])
+    parser.add_argument("--message-length", nargs="+", type=int, default=[RANDOM_MESSAGE_LENGTH])
+    parser.add_argument("--max-trials", type=int, default=1_000_000, help="trial/step cap per run")
+    parser.add_argument("--seed", type=int, default=None, help="base seed for reproducible cells")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    cells = build_grid(
+        engines=args.engine,
+        bits=args.bits,
+        runs=args.runs,
+        message_lengths=args.message_length,
+        max_trials=args.max_trials,
+        seed=args.seed,
+    )
+    run_batch(
+        cells,
+        args.out,
+        workers=args.workers,
+        log=lambda line: print(line, file=sys.stderr, flush=True),
+    )
+    return 0
+
+
+__all__ = [
+    "BatchCell",
+    "ENGINES",
+    "build_grid",
+    "main",
+    "run_batch",
+    "run_cell",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
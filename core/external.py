@@ -0,0 +1,289 @@
+"""External-memory collision search for digest sets larger than RAM.
+
+Messages are derived from a counter (``salt || counter``), so only the
+``(digest, counter)`` pairs need to be kept. They are hashed in chunks that fit
+the memory budget, each chunk is sorted by digest and spilled to disk as a
+*run*, and the runs are then merged block by block through memory-mapped
+files. Every group of equal digests yields all of its colliding pairs. Apart
+from the sequential run I/O, memory use stays bounded by ``memory_budget``.
+
+Usage::
+
+    python -m core.external --bits 40 --count 4294967296 --message-length 5 \\
+        --memory-budget-mb 4096 --temp-dir /scratch > pairs.csv
+"""
+from __future__ import annotations
+
+import argparse
+import bisect
+import os
+from pathlib import Path
+import sys
+import tempfile
+from typing import Callable, Iterator, Sequence
+
+import numpy as np
+
+from .hash_utils import DEFAULT_HASH_BITS, toy_hash
+
+
+RECORD_DTYPE = np.dtype([("digest", "<u8"), ("counter", "<u8")])
+DEFAULT_MEMORY_BUDGET = 256 * 2**20  # bytes
+MAX_DIGEST_BITS = 64
+FILL_BATCH_RECORDS = 4096
+# Peak bytes per buffered record while merging: the run buffer, its
+# concatenated copy and the one-byte duplicate mask in ``_emit_pairs``.
+MERGE_BYTES_PER_RECORD = 2 * RECORD_DTYPE.itemsize + 1
+# Memory map, buffer view and bookkeeping kept for every open run.
+RUN_OVERHEAD_BYTES = 4096
+
+ProgressCallback = Callable[[str, int, int], None]
+
+
+def counter_message(counter: int, length: int = 8, *, salt: bytes = b"") -> bytes:
+    """Return the message hashed for ``counter``: ``salt`` followed by its big-endian bytes."""
+
+    return salt + counter.to_bytes(length, "big")
+
+
+def _plan_chunk_records(count: int, memory_budget: int) -> int:
+    """Return the largest run length whose merge fits ``memory_budget``."""
+
+    chunk_records = memory_budget // MERGE_BYTES_PER_RECORD
+    while chunk_records >= 1:
+        runs = -(-count // chunk_records)
+        # More runs mean more per-run overhead, so shrink until the plan fits.
+        fitted = (memory_budget - runs * RUN_OVERHEAD_BYTES) // MERGE_BYTES_PER_RECORD
+        if fitted >= chunk_records:
+            return chunk_records
+        chunk_records = fitted
+    raise ValueError("memory_budget is too small to hold a single record per run")
+
+
+def _write_runs(
+    directory: Path,
+    *,
+    bits: int,
+    count: int,
+    message_length: int,
+    salt: bytes,
+    chunk_records: int,
+    progress: ProgressCallback | None,
+) -> list[Path]:
+    runs: list[Path] = []
+    fill_records = min(chunk_records, FILL_BATCH_RECORDS)
+    for first in range(0, count, chunk_records):
+        last = min(first + chunk_records, count)
+        chunk = np.empty(last - first, dtype=RECORD_DTYPE)
+        # Filled in small batches so the temporaries stay negligible next to the chunk.
+        for low in range(first, last, fill_records):
+            high = min(low + fill_records, last)
+            chunk["counter"][low - first : high - first] = np.arange(low, high, dtype=np.uint64)
+            chunk["digest"][low - first : high - first] = np.fromiter(
+                (toy_hash(counter_message(counter, message_length, salt=salt), bits) for counter in range(low, high)),
+                dtype=np.uint64,
+                count=high - low,
+            )
+        # In-place sort: no index array or permuted copy.
+        chunk.sort(order=("digest", "counter"))
+        path = directory / f"run-{len(runs):06d}.npy"
+        np.save(path, chunk)
+        del chunk
+        runs.append(path)
+        if progress is not None:
+            progress("hash", last, count)
+    return runs
+
+
+def _group_pairs(records: np.ndarray, start: int, stop: int) -> Iterator[tuple[int, int, int]]:
+    digest = int(records["digest"][start])
+    counters = records["counter"][start:stop].tolist()
+    for index, first in enumerate(counters):
+        for second in counters[index + 1 :]:
+            yield digest, first, second
+
+
+def _emit_pairs(records: np.ndarray) -> Iterator[tuple[int, int, int]]:
+    """Yield all pairs of ``records``, which must be sorted by (digest, counter)."""
+
+    if len(records) < 2:
+        return
+    digests = records["digest"]
+    # Position ``p`` means ``records[p + 1]`` repeats the digest of ``records[p]``.
+    # Groups are walked lazily so nothing is allocated per colliding group.
+    repeats = np.flatnonzero(digests[1:] == digests[:-1])
+    start = stop = -1
+    for position in repeats:
+        position = int(position)
+        if position + 1 != stop:
+            if stop > 0:
+                yield from _group_pairs(records, start, stop)
+            start = position
+        stop = position + 2
+    if stop > 0:
+        yield from _group_pairs(records, start, stop)
+
+
+def _merge_runs(
+    runs: list[Path],
+    *,
+    block_records: int,
+    total: int,
+    progress: ProgressCallback | None,
+) -> Iterator[tuple[int, int, int]]:
+    maps = [np.load(path, mmap_mode="r") for path in runs]
+    positions = [0] * len(maps)
+    buffers = [np.empty(0, dtype=RECORD_DTYPE) for _ in maps]
+    merged = 0
+
+    def load(index: int) -> None:
+        end = min(positions[index] + block_records, len(maps[index]))
+        if not len(buffers[index]):
+            # Release the drained block before reading its successor.
+            buffers[index] = np.empty(0, dtype=RECORD_DTYPE)
+        block = np.array(maps[index][positions[index] : end])
+        buffers[index] = np.concatenate((buffers[index], block)) if len(buffers[index]) else block
+        positions[index] = end
+
+    while True:
+        for index in range(len(maps)):
+            if not len(buffers[index]) and positions[index] < len(maps[index]):
+                load(index)
+        live = [index for index in range(len(maps)) if len(buffers[index])]
+        if not live:
+            return
+
+        # Records below the smallest buffered tail of a run with unread data are
+        # complete: no later block of any run can contain a smaller digest.
+        pending = [index for index in live if positions[index] < len(maps[index])]
+        threshold = min(int(buffers[index]["digest"][-1]) for index in pending) if pending else None
+
+        taken: list[np.ndarray] = []
+        for index in live:
+            buffer = buffers[index]
+            # bisect reads the strided field in place; searchsorted would copy it.
+            cut = len(buffer) if threshold is None else bisect.bisect_left(buffer["digest"], threshold)
+            if cut:
+                taken.append(buffer[:cut])
+                buffers[index] = buffer[cut:]
+
+        if not taken:
+            # A run's whole block shares the threshold digest; read further so
+            # the group is never split across merge steps.
+            for index in pending:
+                if int(buffers[index]["digest"][-1]) == threshold:
+                    load(index)
+            continue
+
+        records = np.concatenate(taken)
+        del taken
+        records.sort(order=("digest", "counter"))
+        merged += len(records)
+        yield from _emit_pairs(records)
+        del records
+        if progress is not None:
+            progress("merge", merged, total)
+
+
+def external_collisions(
+    *,
+    bits: int = DEFAULT_HASH_BITS,
+    count: int,
+    message_length: int = 8,
+    salt: bytes = b"",
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    temp_dir: str | os.PathLike[str] | None = None,
+    progress: ProgressCallback | None = None,
+) -> Iterator[tuple[int, int, int]]:
+    """Yield every colliding pair among the first ``count`` counter messages.
+
+    Pairs are ``(digest, first_counter, second_counter)`` with
+    ``first_counter < second_counter``, in ascending digest order; the
+    messages are recovered with ``counter_message``. Sorted runs are spilled
+    under ``temp_dir`` (system default when ``None``) and removed when the
+    generator finishes or is closed. ``progress`` receives
+    ``(phase, done, total)`` with phase ``"hash"`` or ``"merge"``.
+
+    ``memory_budget`` bounds the record buffers, the merge step and a fixed
+    allowance per run. Only a digest group larger than a merge block, which
+    is read in full, and the positions of colliding records can exceed it.
+
+    Raises:
+        ValueError: If ``bits`` exceeds 64, the counters do not fit in
+            ``message_length`` bytes, or the memory budget cannot hold one
+            record per run.
+    """
+
+    if not 0 < bits <= MAX_DIGEST_BITS:
+        raise ValueError(f"bits must be between 1 and {MAX_DIGEST_BITS}")
+    if count < 0:
+        raise ValueError("count must be non-negative")
+    if count > 256**message_length:
+        raise ValueError("count exceeds the counters representable in message_length bytes")
+    chunk_records = _plan_chunk_records(count, memory_budget)
+
+    with tempfile.TemporaryDirectory(prefix="collisions-", dir=temp_dir) as directory:
+        runs = _write_runs(
+            Path(directory),
+            bits=bits,
+            count=count,
+            message_length=message_length,
+            salt=salt,
+            chunk_records=chunk_records,
+            progress=progress,
+        )
+        if not runs:
+            return
+        # All run buffers together hold ``chunk_records`` records.
+        block_records = max(1, chunk_records // len(runs))
+        yield from _merge_runs(runs, block_records=block_records, total=count, progress=progress)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m core.external",
+        description="Write every colliding counter pair as CSV using bounded memory.",
+    )
+    parser.add_argument("--bits", type=int, default=DEFAULT_HASH_BITS)
+    parser.add_argument("--count", type=int, required=True, help="number of counter messages to hash")
+    parser.add_argument("--message-length", type=int, default=8)
+    parser.add_argument("--salt", default="", help="text prefixed to every message")
+    parser.add_argument("--memory-budget-mb", type=int, default=DEFAULT_MEMORY_BUDGET // 2**20)
+    parser.add_argument("--temp-dir", type=Path, default=None, help="directory for sorted runs")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    last_report: dict[str, int] = {}
+
+    def report(phase: str, done: int, total: int) -> None:
+        percent = 100 * done // max(total, 1)
+        if last_report.get(phase) != percent:
+            last_report[phase] = percent
+            print(f"{phase}: {done:,}/{total:,} ({percent}%)", file=sys.stderr, flush=True)
+
+    print("digest,first_counter,second_counter")
+    for digest, first, second in external_collisions(
+        bits=args.bits,
+        count=args.count,
+        message_length=args.message_length,
+        salt=args.salt.encode(),
+        memory_budget=args.memory_budget_mb * 2**20,
+        temp_dir=args.temp_dir,
+        progress=report,
+    ):
+        print(f"{digest},{first},{second}")
+    return 0
+
+
+__all__ = [
+    "DEFAULT_MEMORY_BUDGET",
+    "counter_message",
+    "external_collisions",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Callable, Dict, List
 
 from .hash_utils import toy_hash, DEFAULT_HASH_BITS
@@ -23,28 +24,112 @@ class PollardResult:
     hare_path: list[int]
 
 
-def _locate_cycle_parameters(
-    *,
-    bits: int,
-    start: int,
-    meeting: int,
-) -> tuple[int, int]:
-    """Compute the tail (μ) and cycle (λ) length after a collision was detected."""
-
-    tortoise = start
-    hare = meeting
-    mu = 0
-    while tortoise != hare:
-        tortoise = _hash_step(tortoise, bits)
-        hare = _hash_step(hare, bits)
-        mu += 1
-
-    hare = _hash_step(tortoise, bits)
-    lam = 1
-    while tortoise != hare:
-        hare = _hash_step(hare, bits)
-        lam += 1
-    return mu, lam
+class RhoWalk:
+    """Single walk of ``x -> f(x)`` from ``start`` shared by the rho helpers.
+
+    Every state is hashed exactly once and indexed on first sight, so the tail
+    (μ), cycle (λ), Floyd pointer paths and transition table are all derived
+    from the stored sequence instead of re-hashing it. ``max_states`` caps the
+    walk; a capped walk that never repeats is reported through ``closed``.
+    """
+
+    def __init__(
+        self,
+        *,
+        bits: int = DEFAULT_HASH_BITS,
+        start: int = 1,
+        max_states: int | None = None,
+    ) -> None:
+        self.bits = bits
+        self.start = start
+        first_seen: dict[int, int] = {}
+        states: list[int] = []
+        value = start
+        while value not in first_seen:
+            if max_states is not None and len(states) >= max_states:
+                break
+            first_seen[value] = len(states)
+            states.append(value)
+            value = _hash_step(value, bits)
+        self.states = states
+        self._cycle_start = first_seen.get(value)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the walk revisited a state (and thus contains the full rho)."""
+
+        return self._cycle_start is not None
+
+    def _require_closed(self) -> int:
+        if self._cycle_start is None:
+            raise RuntimeError("rho walk did not close within max_states")
+        return self._cycle_start
+
+    @property
+    def tail_length(self) -> int:
+        """Number of states before the cycle (μ)."""
+
+        return self._require_closed()
+
+    @property
+    def cycle_length(self) -> int:
+        """Number of states on the cycle (λ)."""
+
+        return len(self.states) - self._require_closed()
+
+    def state(self, index: int) -> int:
+        """Return ``f^index(start)``, wrapping around the cycle when closed."""
+
+        if index < 0:
+            raise IndexError("state index must be non-negative")
+        if index < len(self.states):
+            return self.states[index]
+        mu = self._require_closed()
+        return self.states[mu + (index - mu) % (len(self.states) - mu)]
+
+    @property
+    def meeting_iteration(self) -> int:
+        """Iteration at which Floyd's tortoise and hare first meet."""
+
+        mu, lam = self.tail_length, self.cycle_length
+        return lam * max(1, -(-mu // lam))
+
+    @property
+    def collision_value(self) -> int:
+        return self.state(self.meeting_iteration)
+
+    @cached_property
+    def tortoise_path(self) -> list[int]:
+        return [self.state(step) for step in range(self.meeting_iteration + 1)]
+
+    @cached_property
+    def hare_path(self) -> list[int]:
+        return [self.state(2 * step) for step in range(self.meeting_iteration + 1)]
+
+    def transitions(self, steps: int | None = None) -> dict[int, int]:
+        """Return ``state -> f(state)`` for the first ``steps`` walked states."""
+
+        count = len(self.states) if self.closed else len(self.states) - 1
+        if steps is not None:
+            count = max(0, min(count, steps))
+        return {self.states[index]: self.state(index + 1) for index in range(count)}
+
+    def result(self) -> PollardResult:
+        """Package the walk as the ``PollardResult`` Floyd's method would produce."""
+
+        return PollardResult(
+            collision_value=self.collision_value,
+            iterations=self.meeting_iteration,
+            tail_length=self.tail_length,
+            cycle_length=self.cycle_length,
+            tortoise_path=self.tortoise_path,
+            hare_path=self.hare_path,
+        )
+
+
+def _check_walk(walk: RhoWalk, *, bits: int, start: int) -> None:
+    if walk.bits != bits or walk.start != start:
+        raise ValueError("walk was computed for a different bits/start")
 
 
 def pollard_rho(
@@ -52,31 +137,22 @@ def pollard_rho(
     bits: int = DEFAULT_HASH_BITS,
     start: int = 1,
     max_steps: int = 100_000,
+    walk: RhoWalk | None = None,
 ) -> PollardResult:
-    """Execute Floyd's cycle detection for the toy hash function."""
-
-    tortoise = start
-    hare = start
-    tortoise_path = [tortoise]
-    hare_path = [hare]
-
-    for iteration in range(1, max_steps + 1):
-        tortoise = _hash_step(tortoise, bits)
-        hare = _hash_step(_hash_step(hare, bits), bits)
-        tortoise_path.append(tortoise)
-        hare_path.append(hare)
-        if tortoise == hare:
-            mu, lam = _locate_cycle_parameters(bits=bits, start=start, meeting=tortoise)
-            return PollardResult(
-                collision_value=tortoise,
-                iterations=iteration,
-                tail_length=mu,
-                cycle_length=lam,
-                tortoise_path=tortoise_path,
-                hare_path=hare_path,
-            )
-
-    raise RuntimeError("Pollard rho did not converge within max_steps")
+    """Execute Floyd's cycle detection for the toy hash function.
+
+    The tortoise/hare trajectory is reconstructed from a single ``RhoWalk``;
+    pass ``walk`` to reuse one that was already computed for ``bits``/``start``.
+    """
+
+    if walk is None:
+        # The hare reaches f^(2 * max_steps)(start), so no more states are needed.
+        walk = RhoWalk(bits=bits, start=start, max_states=2 * max_steps + 1)
+    else:
+        _check_walk(walk, bits=bits, start=start)
+    if not walk.closed or walk.meeting_iteration > max_steps:
+        raise RuntimeError("Pollard rho did not converge within max_steps")
+    return walk.result()
 
 
 def pollard_trace(
@@ -84,22 +160,20 @@ def pollard_trace(
     bits: int = DEFAULT_HASH_BITS,
     start: int = 1,
     steps: int = 200,
+    walk: RhoWalk | None = None,
 ) -> dict[int, int]:
     """Return a mapping of ``state -> f(state)`` for visualization graphs."""
 
-    trace: dict[int, int] = {}
-    value = start
-    for _ in range(steps):
-        next_value = _hash_step(value, bits)
-        trace[value] = next_value
-        value = next_value
-        if value in trace:
-            break
-    return trace
+    if walk is None:
+        walk = RhoWalk(bits=bits, start=start, max_states=max(steps, 0) + 1)
+    else:
+        _check_walk(walk, bits=bits, start=start)
+    return walk.transitions(steps)
 
 
 __all__ = [
     "PollardResult",
+    "RhoWalk",
     "pollard_rho",
     "pollard_trace",
 ]
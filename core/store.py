@@ -0,0 +1,340 @@
+"""Persistent columnar store for experiment results.
+
+Each ``append`` writes one *segment*: a directory holding one ``.npy`` file per
+column, all rows sharing the same experiment parameters. A per-table
+``manifest.jsonl`` records every segment's parameters, row count and column
+statistics, so parameter filters prune whole segments before any column is
+opened and aggregates over the full history are answered from the manifest
+alone. ``aggregate.json`` caches those statistics per distinct parameter set
+together with the manifest offset it covers, so ``summarize`` only parses
+manifest lines appended since the last call. ``scan`` reads column files
+memory-mapped; ``load`` copies them into
+one array per column.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import shutil
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+import uuid
+
+import numpy as np
+
+from .birthday import BirthdayRun
+from .pollard import PollardResult
+
+
+MANIFEST_FILENAME = "manifest.jsonl"
+AGGREGATE_FILENAME = "aggregate.json"
+COLUMN_DTYPE = np.int64
+# Marks a value that does not exist, e.g. the cycle length of a walk that never converged.
+MISSING = -1
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Manifest entry describing one appended block of rows."""
+
+    table: str
+    name: str
+    rows: int
+    params: dict[str, Any]
+    stats: dict[str, dict[str, int]]
+
+
+@dataclass(frozen=True)
+class ColumnSummary:
+    """Aggregate of one column over a group of segments.
+
+    ``rows`` counts present values only; ``MISSING`` entries are tallied in
+    ``missing`` and excluded from the total and the extrema.
+    """
+
+    rows: int
+    missing: int
+    total: int
+    minimum: int | None
+    maximum: int | None
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.rows if self.rows else float("nan")
+
+
+def birthday_columns(runs: Sequence[BirthdayRun]) -> dict[str, np.ndarray]:
+    """Return typed columns for ``runs``; ``collision_value`` is -1 when none was found."""
+
+    return {
+        "run": np.arange(1, len(runs) + 1, dtype=COLUMN_DTYPE),
+        "trials": np.fromiter((run.trials for run in runs), dtype=COLUMN_DTYPE, count=len(runs)),
+        "collision": np.fromiter((run.collision is not None for run in runs), dtype=COLUMN_DTYPE, count=len(runs)),
+        "collision_value": np.fromiter(
+            (run.collision.collision_value if run.collision else -1 for run in runs),
+            dtype=COLUMN_DTYPE,
+            count=len(runs),
+        ),
+    }
+
+
+def pollard_columns(starts: Sequence[int], results: Sequence[PollardResult | None]) -> dict[str, np.ndarray]:
+    """Return typed columns for Pollard runs; ``None`` results are stored as ``MISSING``."""
+
+    def column(attribute: str) -> np.ndarray:
+        return np.fromiter(
+            (getattr(result, attribute) if result is not None else MISSING for result in results),
+            dtype=COLUMN_DTYPE,
+            count=len(results),
+        )
+
+    return {
+        "start": np.asarray(starts, dtype=COLUMN_DTYPE),
+        "converged": np.fromiter((result is not None for result in results), dtype=COLUMN_DTYPE, count=len(results)),
+        "iterations": column("iterations"),
+        "tail_length": column("tail_length"),
+        "cycle_length": column("cycle_length"),
+        "collision_value": column("collision_value"),
+    }
+
+
+def _column_stats(array: np.ndarray) -> dict[str, int | None]:
+    present = array[array != MISSING]
+    if not len(present):
+        return {"count": 0, "sum": 0, "min": None, "max": None}
+    return {"count": len(present), "sum": int(present.sum()), "min": int(present.min()), "max": int(present.max())}
+
+
+def _extreme(pick: Any, *values: int | None) -> int | None:
+    present = [value for value in values if value is not None]
+    return pick(present) if present else None
+
+
+def _add_stats(summary: ColumnSummary | None, stats: Mapping[str, Any], rows: int) -> ColumnSummary:
+    summary = summary or ColumnSummary(rows=0, missing=0, total=0, minimum=None, maximum=None)
+    # Manifests written before ``count`` existed had no missing values.
+    count = stats.get("count", rows)
+    return ColumnSummary(
+        rows=summary.rows + count,
+        missing=summary.missing + rows - count,
+        total=summary.total + stats["sum"],
+        minimum=_extreme(min, summary.minimum, stats["min"]),
+        maximum=_extreme(max, summary.maximum, stats["max"]),
+    )
+
+
+def _merge_column_stats(current: Mapping[str, Any] | None, stats: Mapping[str, Any], rows: int) -> dict[str, Any]:
+    count = stats.get("count", rows)
+    if current is None:
+        return {"count": count, "sum": stats["sum"], "min": stats["min"], "max": stats["max"]}
+    return {
+        "count": current["count"] + count,
+        "sum": current["sum"] + stats["sum"],
+        "min": _extreme(min, current["min"], stats["min"]),
+        "max": _extreme(max, current["max"], stats["max"]),
+    }
+
+
+def _matches(params: Mapping[str, Any], filters: Mapping[str, Any]) -> bool:
+    for key, wanted in filters.items():
+        value = params.get(key)
+        if isinstance(wanted, (list, tuple, set, frozenset, range)):
+            if value not in wanted:
+                return False
+        elif value != wanted:
+            return False
+    return True
+
+
+class ResultStore:
+    """Append-only collection of result tables rooted at ``root``."""
+
+    def __init__(self, root: str | os.PathLike[str]) -> None:
+        self.root = Path(root)
+
+    def _table_dir(self, table: str) -> Path:
+        return self.root / table
+
+    def segments(self, table: str, **filters: Any) -> list[Segment]:
+        """Return manifest entries of ``table`` whose parameters match ``filters``.
+
+        A filter value may be a scalar (equality) or a collection (membership).
+        """
+
+        manifest = self._table_dir(table) / MANIFEST_FILENAME
+        if not manifest.exists():
+            return []
+        found: list[Segment] = []
+        with open(manifest, encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if _matches(entry["params"], filters):
+                    found.append(Segment(table=table, **entry))
+        return found
+
+    def _aggregate(self, table: str) -> list[dict[str, Any]]:
+        """Return per-parameter-set totals, folding in manifest lines added since the last call."""
+
+        table_dir = self._table_dir(table)
+        manifest = table_dir / MANIFEST_FILENAME
+        if not manifest.exists():
+            return []
+        cache_path = table_dir / AGGREGATE_FILENAME
+        cache: dict[str, Any] = {"offset": 0, "groups": {}}
+        if cache_path.exists():
+            with open(cache_path, encoding="utf-8") as handle:
+                cache = json.load(handle)
+        if manifest.stat().st_size < cache["offset"]:
+            # The manifest was replaced; start over.
+            cache = {"offset": 0, "groups": {}}
+
+        offset = cache["offset"]
+        groups: dict[str, dict[str, Any]] = cache["groups"]
+        with open(manifest, "rb") as handle:
+            handle.seek(offset)
+            for raw in handle:
+                if not raw.endswith(b"\n"):
+                    break  # an append in progress; fold it next time
+                offset += len(raw)
+                if not raw.strip():
+                    continue
+                entry = json.loads(raw)
+                key = json.dumps(entry["params"], sort_keys=True)
+                group = groups.setdefault(key, {"params": entry["params"], "rows": 0, "stats": {}})
+                group["rows"] += entry["rows"]
+                for column, stats in entry["stats"].items():
+                    group["stats"][column] = _merge_column_stats(group["stats"].get(column), stats, entry["rows"])
+
+        if offset != cache["offset"]:
+            cache["offset"] = offset
+            partial = cache_path.with_name(f"{AGGREGATE_FILENAME}.{os.getpid()}.partial")
+            try:
+                with open(partial, "w", encoding="utf-8") as handle:
+                    json.dump(cache, handle)
+                os.replace(partial, cache_path)
+            except OSError:
+                pass  # a read-only store still answers from the freshly folded totals
+        return list(groups.values())
+
+    def segment_names(self, table: str) -> set[str]:
+        return {segment.name for segment in self.segments(table)}
+
+    def append(
+        self,
+        table: str,
+        columns: Mapping[str, Sequence[int] | np.ndarray],
+        params: Mapping[str, Any],
+        *,
+        name: str | None = None,
+    ) -> Segment:
+        """Persist ``columns`` as a new segment of ``table`` tagged with ``params``.
+
+        Raises:
+            ValueError: If the columns differ in length or ``name`` is already committed.
+        """
+
+        arrays = {key: np.ascontiguousarray(values, dtype=COLUMN_DTYPE) for key, values in columns.items()}
+        lengths = {array.shape for array in arrays.values()}
+        if len(lengths) > 1 or any(len(shape) != 1 for shape in lengths):
+            raise ValueError("columns must be one-dimensional and of equal length")
+        rows = next(iter(arrays.values())).shape[0] if arrays else 0
+
+        table_dir = self._table_dir(table)
+        table_dir.mkdir(parents=True, exist_ok=True)
+        if name is None:
+            name = f"seg-{uuid.uuid4().hex}"
+        elif name in self.segment_names(table):
+            raise ValueError(f"segment {name!r} already exists in table {table!r}")
+        target = table_dir / name
+        partial = table_dir / f"{name}.partial"
+        for stale in (partial, target):
+            # Leftovers from an interrupted append that never reached the manifest.
+            if stale.exists():
+                shutil.rmtree(stale)
+        partial.mkdir()
+        for key, array in arrays.items():
+            np.save(partial / f"{key}.npy", array)
+        os.replace(partial, target)
+
+        stats = {key: _column_stats(array) for key, array in arrays.items()}
+        segment = Segment(table=table, name=name, rows=rows, params=dict(params), stats=stats)
+        entry = {"name": name, "rows": rows, "params": segment.params, "stats": stats}
+        # The manifest line is the commit point for readers.
+        with open(table_dir / MANIFEST_FILENAME, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry) + "\n")
+        return segment
+
+    def read_segment(self, segment: Segment, columns: Iterable[str] | None = None) -> dict[str, np.ndarray]:
+        """Return memory-mapped arrays for ``columns`` (default: all) of ``segment``."""
+
+        directory = self._table_dir(segment.table) / segment.name
+        names = list(columns) if columns is not None else sorted(path.stem for path in directory.glob("*.npy"))
+        # Zero-length files cannot be mapped; they are cheap to read eagerly.
+        mode = "r" if segment.rows else None
+        return {key: np.load(directory / f"{key}.npy", mmap_mode=mode) for key in names}
+
+    def scan(
+        self,
+        table: str,
+        columns: Iterable[str] | None = None,
+        **filters: Any,
+    ) -> Iterator[tuple[Segment, dict[str, np.ndarray]]]:
+        """Yield ``(segment, arrays)`` for every segment matching ``filters``."""
+
+        wanted = list(columns) if columns is not None else None
+        for segment in self.segments(table, **filters):
+            yield segment, self.read_segment(segment, wanted)
+
+    def load(self, table: str, columns: Iterable[str] | None = None, **filters: Any) -> dict[str, np.ndarray]:
+        """Concatenate matching segments into one in-memory array per column.
+
+        This copies every matching row into RAM; use ``scan`` to walk large
+        histories segment by segment through memory maps. Integer parameters
+        are broadcast into extra columns so the rows stay self-describing.
+        """
+
+        blocks: list[tuple[int, dict[str, np.ndarray]]] = []
+        for segment, arrays in self.scan(table, columns, **filters):
+            block = dict(arrays)
+            for key, value in segment.params.items():
+                if isinstance(value, int) and not isinstance(value, bool) and key not in arrays:
+                    block[key] = np.full(segment.rows, value, dtype=COLUMN_DTYPE)
+            blocks.append((segment.rows, block))
+
+        # A key missing (or not an int, e.g. ``seed=None``) in some segments is
+        # filled with -1 there so every returned column has the same length.
+        keys = dict.fromkeys(key for _, block in blocks for key in block)
+        return {
+            key: np.concatenate(
+                [block[key] if key in block else np.full(rows, MISSING, dtype=COLUMN_DTYPE) for rows, block in blocks]
+            )
+            for key in keys
+        }
+
+    def summarize(self, table: str, column: str, *, by: str, **filters: Any) -> dict[Any, ColumnSummary]:
+        """Aggregate ``column`` per value of parameter ``by`` from the cached manifest totals.
+
+        ``MISSING`` values are counted separately and left out of the aggregate.
+        """
+
+        groups: dict[Any, ColumnSummary] = {}
+        for group in self._aggregate(table):
+            stats = group["stats"].get(column)
+            if stats is None or not _matches(group["params"], filters):
+                continue
+            key = group["params"].get(by)
+            groups[key] = _add_stats(groups.get(key), stats, group["rows"])
+        return dict(sorted(groups.items(), key=lambda item: (item[0] is None, item[0])))
+
+
+__all__ = [
+    "ColumnSummary",
+    "MISSING",
+    "ResultStore",
+    "Segment",
+    "birthday_columns",
+    "pollard_columns",
+]
@@ -0,0 +1,56 @@
+import json
+
+from core.batch import build_grid, main, run_batch, run_cell
+from core.store import ResultStore
+
+
+def test_grid_collapses_message_length_for_pollard():
+    cells = build_grid(engines=["birthday", "pollard"], bits=[8], runs=[3], message_lengths=[4, 8])
+    assert [cell.engine for cell in cells] == ["birthday", "birthday", "pollard"]
+
+
+def test_run_cell_is_reproducible_with_seed():
+    (cell,) = build_grid(engines=["birthday"], bits=[8], runs=[4], message_lengths=[8], max_trials=1000, seed=7)
+    first, _ = run_cell(cell)
+    second, _ = run_cell(cell)
+    assert first["trials"].tolist() == second["trials"].tolist()
+    assert len(first["trials"]) == 4
+
+
+def test_batch_writes_columns_and_resumes(tmp_path):
+    cells = build_grid(engines=["birthday", "pollard"], bits=[8], runs=[3], message_lengths=[8], max_trials=1000, seed=1)
+    assert run_batch(cells, tmp_path) == cells
+    store = ResultStore(tmp_path)
+    assert store.load("pollard")["cycle_length"].shape == (3,)
+    assert run_batch(cells, tmp_path) == []
+    timings = (tmp_path / "timings.jsonl").read_text().splitlines()
+    assert [json.loads(line)["key"] for line in timings] == [cell.key for cell in cells]
+
+
+def test_resume_reruns_cells_with_other_seed_or_cap(tmp_path):
+    grid = dict(engines=["birthday"], bits=[8], runs=[3], message_lengths=[8])
+    original = build_grid(**grid, max_trials=1000, seed=1)
+    run_batch(original, tmp_path)
+    reseeded = build_grid(**grid, max_trials=1000, seed=2)
+    recapped = build_grid(**grid, max_trials=500, seed=1)
+    assert run_batch(reseeded, tmp_path) == reseeded
+    assert run_batch(recapped, tmp_path) == recapped
+    assert len(ResultStore(tmp_path).segments("birthday", bits=8)) == 3
+
+
+def test_cli_runs_grid(tmp_path):
+    assert main(["--out", str(tmp_path), "--bits", "8", "--runs", "2", "--max-trials", "500", "--workers", "1"]) == 0
+    assert ResultStore(tmp_path).segments("birthday", bits=8)
+
+
+def test_pollard_seed_selects_start_states(tmp_path):
+    grid = dict(engines=["pollard"], bits=[10], runs=[4], message_lengths=[8], max_trials=5000)
+    first = build_grid(**grid, seed=1)
+    second = build_grid(**grid, seed=2)
+    assert run_batch(first, tmp_path) == first
+    assert run_batch(second, tmp_path) == second
+    assert run_batch(first + second, tmp_path) == []
+    store = ResultStore(tmp_path)
+    starts = [store.load("pollard", seed=seed)["start"].tolist() for seed in (1, 2)]
+    assert starts[0] != starts[1]
+    assert len(set(starts[0])) == 4
@@ -0,0 +1,69 @@
+from collections import defaultdict
+import tracemalloc
+
+import pytest
+
+from core.external import _merge_runs, _write_runs, counter_message, external_collisions
+from core.hash_utils import toy_hash
+
+
+def _in_memory_pairs(bits, count):
+    groups = defaultdict(list)
+    for counter in range(count):
+        groups[toy_hash(counter_message(counter), bits)].append(counter)
+    return sorted(
+        (digest, first, second)
+        for digest, counters in groups.items()
+        for index, first in enumerate(counters)
+        for second in counters[index + 1 :]
+    )
+
+
+def test_external_merge_matches_in_memory_search(tmp_path):
+    # 128 KiB forces seven sorted runs for 20k records.
+    pairs = list(external_collisions(bits=16, count=20_000, memory_budget=128 * 2**10, temp_dir=tmp_path))
+    assert pairs == _in_memory_pairs(16, 20_000)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_merge_keeps_groups_larger_than_a_block_together(tmp_path):
+    # With two digest values every block is one group and must be extended.
+    runs = _write_runs(tmp_path, bits=1, count=600, message_length=8, salt=b"", chunk_records=100, progress=None)
+    pairs = sorted(_merge_runs(runs, block_records=8, total=600, progress=None))
+    assert pairs == _in_memory_pairs(1, 600)
+
+
+def test_external_collisions_stays_within_memory_budget():
+    budget = 512 * 2**10
+    tracemalloc.start()
+    try:
+        pairs = sum(1 for _ in external_collisions(bits=24, count=100_000, memory_budget=budget))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert pairs > 0
+    assert peak <= budget
+
+
+def test_external_collisions_reports_progress(tmp_path):
+    events = []
+    list(
+        external_collisions(
+            bits=10,
+            count=500,
+            memory_budget=64 * 2**10,
+            temp_dir=tmp_path,
+            progress=lambda phase, done, total: events.append((phase, done, total)),
+        )
+    )
+    assert ("hash", 500, 500) in events
+    assert events[-1] == ("merge", 500, 500)
+
+
+def test_external_collisions_validates_parameters():
+    with pytest.raises(ValueError):
+        list(external_collisions(bits=65, count=10))
+    with pytest.raises(ValueError):
+        list(external_collisions(bits=8, count=300, message_length=1))
+    with pytest.raises(ValueError):
+        list(external_collisions(bits=8, count=10**6, memory_budget=2**10))
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+UI_DEPENDENCIES = ("pandas", "plotly", "streamlit")
+CORE_IMPORT_BUDGET_US = 150_000
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_core_does_not_import_ui_dependencies():
+    code = (
+        "import sys, core, core.batch, core.store\n"
+        f"print(','.join(name for name in {UI_DEPENDENCIES!r} if name in sys.modules))"
+    )
+    assert _run(code).stdout.strip() == ""
+
+
+def test_core_import_time_budget():
+    stderr = _run("import core", "-X", "importtime").stderr
+    (line,) = [line for line in stderr.splitlines() if line.rstrip().endswith("| core")]
+    cumulative_us = int(line.split("|")[1])
+    assert cumulative_us < CORE_IMPORT_BUDGET_US
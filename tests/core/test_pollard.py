@@ -1,4 +1,6 @@
-from core.pollard import pollard_rho, pollard_trace
+import pytest
+
+from core.pollard import RhoWalk, _hash_step, pollard_rho, pollard_trace
 
 
 def test_pollard_rho_detects_cycle():
@@ -16,3 +18,64 @@ def test_pollard_trace_mapping_not_empty():
     for state, nxt in mapping.items():
         assert isinstance(state, int)
         assert isinstance(nxt, int)
+
+
+def _reference_floyd(bits, start):
+    # Independent textbook Floyd: detect, then locate mu and lambda by re-walking.
+    tortoise, hare, iterations = start, start, 0
+    while True:
+        tortoise = _hash_step(tortoise, bits)
+        hare = _hash_step(_hash_step(hare, bits), bits)
+        iterations += 1
+        if tortoise == hare:
+            break
+    meeting = tortoise
+    mu, tortoise = 0, start
+    while tortoise != hare:
+        tortoise, hare = _hash_step(tortoise, bits), _hash_step(hare, bits)
+        mu += 1
+    lam, hare = 1, _hash_step(tortoise, bits)
+    while tortoise != hare:
+        hare = _hash_step(hare, bits)
+        lam += 1
+    return meeting, iterations, mu, lam
+
+
+@pytest.mark.parametrize("bits", range(4, 13))
+def test_rho_walk_matches_reference_floyd(bits):
+    for start in range(60):
+        result = pollard_rho(bits=bits, start=start, max_steps=10_000)
+        meeting, iterations, mu, lam = _reference_floyd(bits, start)
+        assert (result.collision_value, result.iterations, result.tail_length, result.cycle_length) == (
+            meeting,
+            iterations,
+            mu,
+            lam,
+        )
+        assert result.tortoise_path[-1] == result.hare_path[-1] == meeting
+
+
+def test_mismatched_walk_is_rejected():
+    walk = RhoWalk(bits=10, start=1)
+    with pytest.raises(ValueError):
+        pollard_rho(bits=10, start=2, walk=walk)
+    with pytest.raises(ValueError):
+        pollard_trace(bits=12, start=1, walk=walk)
+
+
+def test_rho_walk_hashes_each_state_once():
+    walk = RhoWalk(bits=10, start=3)
+    assert len(walk.states) == len(set(walk.states))
+    assert len(walk.states) == walk.tail_length + walk.cycle_length
+    assert walk.state(len(walk.states)) == walk.states[walk.tail_length]
+
+
+def test_pollard_trace_reuses_walk():
+    walk = RhoWalk(bits=10, start=2)
+    assert pollard_trace(bits=10, start=2, steps=50, walk=walk) == pollard_trace(bits=10, start=2, steps=50)
+
+
+def test_truncated_walk_is_not_closed():
+    walk = RhoWalk(bits=16, start=1, max_states=3)
+    assert not walk.closed
+    assert len(walk.transitions()) == 2
@@ -0,0 +1,94 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.birthday import simulate_birthday_trials
+from core.pollard import pollard_rho
+from core.store import ResultStore, birthday_columns, pollard_columns
+
+
+def _runs(bits, seed):
+    return simulate_birthday_trials(bits=bits, runs=5, rng=random.Random(seed), max_trials=1000)
+
+
+def test_append_and_load_roundtrip(tmp_path):
+    store = ResultStore(tmp_path)
+    runs = _runs(8, 1)
+    store.append("birthday", birthday_columns(runs), {"bits": 8})
+    data = store.load("birthday")
+    assert data["trials"].tolist() == [run.trials for run in runs]
+    assert data["bits"].tolist() == [8] * 5
+
+
+def test_columns_are_memory_mapped(tmp_path):
+    store = ResultStore(tmp_path)
+    store.append("birthday", birthday_columns(_runs(8, 2)), {"bits": 8})
+    (_, arrays), = store.scan("birthday", ["trials"])
+    assert isinstance(arrays["trials"], np.memmap)
+
+
+def test_filters_prune_segments(tmp_path):
+    store = ResultStore(tmp_path)
+    store.append("birthday", birthday_columns(_runs(8, 3)), {"bits": 8})
+    store.append("birthday", birthday_columns(_runs(10, 4)), {"bits": 10})
+    assert [segment.params["bits"] for segment in store.segments("birthday", bits=10)] == [10]
+    assert len(store.segments("birthday", bits=[8, 10])) == 2
+    assert store.load("birthday", bits=12) == {}
+
+
+def test_summarize_uses_manifest_stats(tmp_path):
+    store = ResultStore(tmp_path)
+    first, second = _runs(8, 5), _runs(8, 6)
+    store.append("birthday", birthday_columns(first), {"bits": 8})
+    store.append("birthday", birthday_columns(second), {"bits": 8})
+    summary = store.summarize("birthday", "trials", by="bits")[8]
+    trials = [run.trials for run in first + second]
+    assert summary.rows == 10
+    assert summary.mean == sum(trials) / 10
+    assert (summary.minimum, summary.maximum) == (min(trials), max(trials))
+
+
+def test_reusing_a_committed_name_is_rejected(tmp_path):
+    store = ResultStore(tmp_path)
+    store.append("birthday", birthday_columns(_runs(8, 7)), {"bits": 8}, name="x")
+    with pytest.raises(ValueError):
+        store.append("birthday", birthday_columns(_runs(9, 8)[:1]), {"bits": 9}, name="x")
+    data = store.load("birthday")
+    assert len(data["trials"]) == len(data["bits"]) == 5
+
+
+def test_load_with_mixed_parameter_types(tmp_path):
+    store = ResultStore(tmp_path)
+    store.append("birthday", birthday_columns(_runs(8, 9)), {"bits": 8, "seed": 1})
+    store.append("birthday", birthday_columns(_runs(8, 10)), {"bits": 8, "seed": None})
+    data = store.load("birthday")
+    assert {len(column) for column in data.values()} == {10}
+    assert data["seed"].tolist() == [1] * 5 + [-1] * 5
+
+
+def test_summary_excludes_failed_pollard_runs(tmp_path):
+    store = ResultStore(tmp_path)
+    converged = pollard_rho(bits=10, start=1, max_steps=5000)
+    store.append("pollard", pollard_columns([1, 2, 3], [converged, None, None]), {"bits": 10})
+    store.append("pollard", pollard_columns([4], [None]), {"bits": 10})
+    summary = store.summarize("pollard", "iterations", by="bits")[10]
+    assert (summary.rows, summary.missing) == (1, 3)
+    assert summary.mean == summary.minimum == summary.maximum == converged.iterations
+    assert store.load("pollard")["converged"].tolist() == [1, 0, 0, 0]
+
+
+def test_summarize_only_parses_new_manifest_lines(tmp_path):
+    store = ResultStore(tmp_path)
+    first = _runs(8, 11)
+    store.append("birthday", birthday_columns(first), {"bits": 8})
+    assert store.summarize("birthday", "trials", by="bits")[8].rows == 5
+
+    # Blank out the already-folded line: a full re-parse would no longer see it.
+    manifest = tmp_path / "birthday" / "manifest.jsonl"
+    manifest.write_text(" " * (len(manifest.read_text()) - 1) + "\n")
+    second = _runs(8, 12)
+    store.append("birthday", birthday_columns(second), {"bits": 8})
+    summary = store.summarize("birthday", "trials", by="bits")[8]
+    assert summary.rows == 10
+    assert summary.total == sum(run.trials for run in first + second)
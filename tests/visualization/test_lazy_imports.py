@@ -0,0 +1,35 @@
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _loaded(code: str, prefixes: tuple[str, ...]) -> set[str]:
+    script = f"import sys\n{code}\nprint('\\n'.join(name for name in sys.modules if name.startswith({prefixes!r})))"
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return set(output.split())
+
+
+def test_visualization_package_loads_pages_lazily():
+    assert _loaded("import visualization", ("visualization.", "pandas", "plotly")) == set()
+
+
+def test_app_import_loads_no_page_or_plotting_stack():
+    # Streamlit itself imports part of plotly, so only plotly.express is checked.
+    loaded = _loaded("import app", ("visualization.", "pandas", "plotly.express", "numpy", "core"))
+    assert loaded == {"visualization.ui_components"}
+
+
+def test_pollard_page_skips_birthday_page_and_plotly_express():
+    loaded = _loaded(
+        "from visualization import pollard_views, scaling_views",
+        ("visualization.birthday_views", "plotly.express"),
+    )
+    assert loaded == set()
@@ -1,8 +1,22 @@
-"""Visualization helpers for the cryptography explorer."""
-from . import birthday_views, pollard_views, ui_components
+"""Visualization helpers for the cryptography explorer.
+
+Page modules are imported on first attribute access so that rendering one
+attack page does not pay for the plotting stack of the others.
+"""
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
 
 __all__ = [
     "birthday_views",
     "pollard_views",
+    "scaling_views",
     "ui_components",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,8 +3,6 @@ from __future__ import annotations
 
 import math
 import random
-from typing import Iterable
-
 import numpy as np
 import pandas as pd
 import plotly.express as px
@@ -16,28 +14,36 @@ from core import (
     estimate_collision_probability,
     simulate_birthday_trials,
 )
-from .ui_components import BirthdayParameters
+from core.store import ResultStore, birthday_columns
+from .scaling_views import difficulty_scaling_dataframe, show_difficulty_scaling
+from .ui_components import BirthdayParameters, record_run
 
 
-def birthday_dataframe(params: BirthdayParameters) -> pd.DataFrame:
+def _simulate(params: BirthdayParameters) -> list[BirthdayRun]:
     rng = random.Random(params.rng_seed) if params.rng_seed is not None else random.Random()
-    runs = simulate_birthday_trials(
+    return simulate_birthday_trials(
         bits=params.bits,
         runs=params.runs,
         rng=rng,
         message_length=params.message_length,
         max_trials=params.max_trials,
     )
-    rows = [
+
+
+def _columns_dataframe(columns: dict[str, np.ndarray]) -> pd.DataFrame:
+    collision = columns["collision"].astype(bool)
+    return pd.DataFrame(
         {
-            "run": index + 1,
-            "trials": run.trials,
-            "collision": run.collision is not None,
-            "collision_value": run.collision.collision_value if run.collision else None,
+            "run": columns["run"],
+            "trials": columns["trials"],
+            "collision": collision,
+            "collision_value": pd.Series(columns["collision_value"]).where(collision),
         }
-        for index, run in enumerate(runs)
-    ]
-    return pd.DataFrame(rows)
+    )
+
+
+def birthday_dataframe(params: BirthdayParameters) -> pd.DataFrame:
+    return _columns_dataframe(birthday_columns(_simulate(params)))
 
 
 def birthday_probability_curve(bits: int, max_trials: int, points: int = 50) -> pd.DataFrame:
@@ -46,8 +52,23 @@ def birthday_probability_curve(bits: int, max_trials: int, points: int = 50) ->
     return pd.DataFrame({"trials": trial_counts, "probability": probabilities})
 
 
-def show_birthday(params: BirthdayParameters) -> None:
-    data = birthday_dataframe(params)
+def show_birthday(params: BirthdayParameters, store: ResultStore | None = None) -> None:
+    columns = birthday_columns(_simulate(params))
+    if store is not None:
+        record_run(
+            store,
+            "birthday",
+            columns,
+            {
+                "engine": "birthday",
+                "bits": params.bits,
+                "runs": params.runs,
+                "message_length": params.message_length,
+                "max_trials": params.max_trials,
+                "seed": params.rng_seed,
+            },
+        )
+    data = _columns_dataframe(columns)
     if data.empty:
         st.info("No collision data available")
         return
@@ -100,35 +121,32 @@ def show_birthday(params: BirthdayParameters) -> None:
     )
 
 
-def difficulty_scaling_dataframe(bit_sizes: Iterable[int]) -> pd.DataFrame:
-    rows = []
-    for bits in bit_sizes:
-        birthday_cost = 2 ** (bits / 2)
-        pollard_cost = math.sqrt(math.pi * (2 ** (bits - 1)))
-        brute_force_cost = 2 ** bits
-        rows.extend(
-            [
-                {"algorithm": "Birthday", "bits": bits, "operations": birthday_cost},
-                {"algorithm": "Pollard's Rho", "bits": bits, "operations": pollard_cost},
-                {"algorithm": "Brute Force", "bits": bits, "operations": brute_force_cost},
-            ]
-        )
-    return pd.DataFrame(rows)
-
+def show_birthday_history(store: ResultStore) -> None:
+    summary = store.summarize("birthday", "trials", by="bits")
+    if not summary:
+        st.info("No stored birthday runs yet")
+        return
 
-def show_difficulty_scaling(bit_sizes: Iterable[int]) -> None:
-    data = difficulty_scaling_dataframe(bit_sizes)
+    data = pd.DataFrame(
+        {
+            "bits": list(summary),
+            "runs": [group.rows for group in summary.values()],
+            "average trials": [group.mean for group in summary.values()],
+            "theoretical": [math.sqrt(math.pi / 2 * 2**bits) for bits in summary],
+        }
+    )
     fig = px.line(
         data,
         x="bits",
-        y="operations",
-        color="algorithm",
+        y=["average trials", "theoretical"],
         log_y=True,
-        title="Attack complexity vs hash size",
+        markers=True,
+        hover_data=["runs"],
+        title="Stored history: average trials to collision",
     )
-    fig.update_traces(mode="markers+lines")
-    fig.update_yaxes(title="Operations (log scale)")
+    fig.update_yaxes(title="Trials (log scale)")
     st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"Aggregated over {int(data['runs'].sum()):,} stored runs.")
 
 
 __all__ = [
@@ -136,5 +154,6 @@ __all__ = [
     "birthday_probability_curve",
     "difficulty_scaling_dataframe",
     "show_birthday",
+    "show_birthday_history",
     "show_difficulty_scaling",
 ]
@@ -5,9 +5,10 @@ import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
-from core import pollard_rho, pollard_trace
+from core import RhoWalk, pollard_rho, pollard_trace
 from core.pollard import PollardResult
-from .ui_components import PollardParameters
+from core.store import ResultStore, pollard_columns
+from .ui_components import PollardParameters, record_run
 
 
 def _path_dataframe(result: PollardResult) -> pd.DataFrame:
@@ -20,8 +21,24 @@ def _path_dataframe(result: PollardResult) -> pd.DataFrame:
     )
 
 
-def show_pollard(params: PollardParameters) -> PollardResult:
-    result = pollard_rho(bits=params.bits, start=params.start, max_steps=params.max_steps)
+def show_pollard(params: PollardParameters, store: ResultStore | None = None) -> PollardResult:
+    # One walk feeds both the pointer plot and the transition table.
+    walk = RhoWalk(bits=params.bits, start=params.start, max_states=2 * params.max_steps + 1)
+    result = pollard_rho(bits=params.bits, start=params.start, max_steps=params.max_steps, walk=walk)
+    if store is not None:
+        record_run(
+            store,
+            "pollard",
+            pollard_columns([params.start], [result]),
+            {
+                "engine": "pollard",
+                "bits": params.bits,
+                "runs": 1,
+                "message_length": 0,
+                "max_trials": params.max_steps,
+                "seed": None,
+            },
+        )
     data = _path_dataframe(result)
 
     fig = go.Figure()
@@ -71,11 +88,29 @@ def show_pollard(params: PollardParameters) -> PollardResult:
     )
 
     st.subheader("State transitions")
-    mapping = pollard_trace(bits=params.bits, start=params.start)
+    mapping = pollard_trace(bits=params.bits, start=params.start, walk=walk)
     table = pd.DataFrame({"state": list(mapping.keys()), "next_state": list(mapping.values())})
     st.dataframe(table.head(20), use_container_width=True, height=300)
 
     return result
 
 
-__all__ = ["show_pollard"]
+def show_pollard_history(store: ResultStore) -> None:
+    summary = store.summarize("pollard", "iterations", by="bits")
+    if not summary:
+        st.info("No stored Pollard runs yet")
+        return
+
+    table = pd.DataFrame(
+        {
+            "bits": list(summary),
+            "converged runs": [group.rows for group in summary.values()],
+            "failed runs": [group.missing for group in summary.values()],
+            "average iterations": [group.mean for group in summary.values()],
+            "max iterations": [group.maximum for group in summary.values()],
+        }
+    )
+    st.dataframe(table, use_container_width=True, hide_index=True)
+
+
+__all__ = ["show_pollard", "show_pollard_history"]
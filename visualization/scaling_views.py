@@ -0,0 +1,53 @@
+"""Attack complexity comparison shared by every attack page."""
+from __future__ import annotations
+
+import math
+from typing import Iterable
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+
+def difficulty_scaling_dataframe(bit_sizes: Iterable[int]) -> pd.DataFrame:
+    rows = []
+    for bits in bit_sizes:
+        birthday_cost = 2 ** (bits / 2)
+        pollard_cost = math.sqrt(math.pi * (2 ** (bits - 1)))
+        brute_force_cost = 2 ** bits
+        rows.extend(
+            [
+                {"algorithm": "Birthday", "bits": bits, "operations": birthday_cost},
+                {"algorithm": "Pollard's Rho", "bits": bits, "operations": pollard_cost},
+                {"algorithm": "Brute Force", "bits": bits, "operations": brute_force_cost},
+            ]
+        )
+    return pd.DataFrame(rows)
+
+
+def show_difficulty_scaling(bit_sizes: Iterable[int]) -> None:
+    # Built with graph_objects so pages that only need this chart skip plotly.express.
+    data = difficulty_scaling_dataframe(bit_sizes)
+    fig = go.Figure()
+    for algorithm, group in data.groupby("algorithm", sort=False):
+        fig.add_trace(
+            go.Scatter(
+                x=group["bits"],
+                y=group["operations"],
+                mode="markers+lines",
+                name=algorithm,
+            )
+        )
+    fig.update_layout(
+        title="Attack complexity vs hash size",
+        xaxis_title="bits",
+        legend_title_text="algorithm",
+    )
+    fig.update_yaxes(type="log", title="Operations (log scale)")
+    st.plotly_chart(fig, use_container_width=True)
+
+
+__all__ = [
+    "difficulty_scaling_dataframe",
+    "show_difficulty_scaling",
+]
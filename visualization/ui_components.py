@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 import streamlit as st
 
+if TYPE_CHECKING:
+    from core.store import ResultStore
+
 
 ATTACK_OPTIONS = [
     "Birthday Attack",
@@ -76,6 +79,27 @@ def info_box(label: str, value: str) -> None:
     st.metric(label, value)
 
 
+def record_run(store: ResultStore, table: str, columns: Mapping[str, Any], params: Mapping[str, Any]) -> bool:
+    """Append a rendered run to ``store`` once per parameter set and session.
+
+    Streamlit reruns the page on every widget interaction, so without this the
+    history would fill with copies of the same run. A store that cannot be
+    written only disables recording.
+    """
+
+    recorded = st.session_state.setdefault("recorded-runs", set())
+    key = (table, tuple(sorted(params.items())))
+    if key in recorded:
+        return False
+    try:
+        store.append(table, columns, params)
+    except OSError:
+        st.caption("Run history is not writable; this run was not recorded.")
+        return False
+    recorded.add(key)
+    return True
+
+
 __all__ = [
     "ATTACK_OPTIONS",
     "BirthdayParameters",
@@ -84,4 +108,5 @@ __all__ = [
     "birthday_controls",
     "info_box",
     "pollard_controls",
+    "record_run",
 ]